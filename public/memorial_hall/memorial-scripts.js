@@ -507,11 +507,14 @@ class MemorialMessages {
         await this.loadMessages();
         this.setupEventListeners();
         this.updateMessageStats();
+        this.connectStream();
     }
     
-    async loadMessages() {
+    async loadMessages(bypassEdgeCache = false) {
         try {
-            const response = await fetch(`${this.apiBase}/messages?limit=20`);
+            // 提交留言后跳过边缘缓存，确保能立即看到自己的留言
+            const query = bypassEdgeCache ? `limit=20&t=${Date.now()}` : 'limit=20';
+            const response = await fetch(`${this.apiBase}/messages?${query}`);
             
             if (!response.ok) {
                 throw new Error(`HTTP错误: ${response.status}`);
@@ -539,7 +542,11 @@ class MemorialMessages {
             return;
         }
         
-        this.messagesContainer.innerHTML = messages.map(msg => `
+        this.messagesContainer.innerHTML = messages.map(msg => this.renderMessageCard(msg)).join('');
+    }
+    
+    renderMessageCard(msg) {
+        return `
             <div class="message-card" data-message-id="${msg.id}">
                 <div class="message-header">
                     <i class="fas fa-user-circle"></i>
@@ -558,7 +565,63 @@ class MemorialMessages {
                         '<span class="pending-badge"><i class="fas fa-clock"></i> 审核中</span>' : ''}
                 </div>
             </div>
-        `).join('');
+        `;
+    }
+    
+    // 实时推送：服务器通过 SSE 推送新留言和统计变化，不支持或连接被拒绝时退回定时轮询
+    connectStream() {
+        if (!window.EventSource) {
+            this.startPolling();
+            return;
+        }
+        
+        // 首次连接带上页面上最新的留言ID，断线重连时浏览器会自动带 Last-Event-ID
+        const latestId = this.latestMessageId();
+        const url = latestId ? `${this.apiBase}/stream?since=${latestId}` : `${this.apiBase}/stream`;
+        this.stream = new EventSource(url);
+        
+        this.stream.addEventListener('message', (e) => this.insertMessage(JSON.parse(e.data)));
+        this.stream.addEventListener('stats', (e) => this.renderStats(JSON.parse(e.data)));
+        // 审核结果：每次审核一个事件，撤下的留言直接删除，其余情况重新加载列表
+        this.stream.addEventListener('moderation', (e) => {
+            const { removed, reload } = JSON.parse(e.data);
+            if (reload) {
+                this.loadMessages();
+                return;
+            }
+            removed.forEach(id => {
+                const card = this.messagesContainer && this.messagesContainer.querySelector(`[data-message-id="${id}"]`);
+                if (card) card.remove();
+            });
+        });
+        this.stream.onerror = () => {
+            // 服务端定期结束连接属正常情况，浏览器会按 retry 自动重连
+            if (this.stream.readyState === EventSource.CLOSED) {
+                this.stream = null;
+                this.startPolling();
+            }
+        };
+    }
+    
+    startPolling() {
+        if (this.pollTimer) return;
+        this.pollTimer = setInterval(() => this.loadMessages(), 60000); // 每60秒刷新一次
+    }
+    
+    latestMessageId() {
+        if (!this.messagesContainer) return 0;
+        const ids = Array.from(this.messagesContainer.querySelectorAll('.message-card'))
+            .map(card => parseInt(card.dataset.messageId, 10) || 0);
+        return ids.length ? Math.max(...ids) : 0;
+    }
+    
+    insertMessage(msg) {
+        if (!this.messagesContainer) return;
+        if (this.messagesContainer.querySelector(`[data-message-id="${msg.id}"]`)) return;
+        
+        const empty = this.messagesContainer.querySelector('.no-messages');
+        if (empty) empty.remove();
+        this.messagesContainer.insertAdjacentHTML('afterbegin', this.renderMessageCard(msg));
     }
     
     async submitMessage(event) {
@@ -613,7 +676,7 @@ class MemorialMessages {
             this.showMessage('留言提交成功！感谢您的纪念', 'success');
             
             // 重新加载留言列表
-            await this.loadMessages();
+            await this.loadMessages(true);
             await this.updateMessageStats();
             
             // 滚动到最新的留言
@@ -634,21 +697,24 @@ class MemorialMessages {
         try {
             const response = await fetch(`${this.apiBase}/stats`);
             const stats = await response.json();
-            
-            // 可以在这里更新页面上的统计信息
-            const statsElement = document.getElementById('messageStats');
-            if (statsElement) {
-                statsElement.innerHTML = `
-                    <span><i class="fas fa-comments"></i> 共 ${stats.total_messages} 条留言</span>
-                    <span><i class="fas fa-history"></i> 最近更新: ${new Date(stats.last_updated).toLocaleDateString()}</span>
-                `;
-            }
+            this.renderStats(stats);
             
         } catch (error) {
             console.error('更新统计信息失败:', error);
         }
     }
     
+    renderStats(stats) {
+        // 可以在这里更新页面上的统计信息
+        const statsElement = document.getElementById('messageStats');
+        if (statsElement) {
+            statsElement.innerHTML = `
+                <span><i class="fas fa-comments"></i> 共 ${stats.total_messages} 条留言</span>
+                <span><i class="fas fa-history"></i> 最近更新: ${new Date(stats.last_updated).toLocaleDateString()}</span>
+            `;
+        }
+    }
+    
     scrollToNewMessage() {
         const messages = this.messagesContainer.querySelectorAll('.message-card');
         if (messages.length > 0) {
@@ -660,9 +726,6 @@ class MemorialMessages {
         if (this.messageForm) {
             this.messageForm.addEventListener('submit', (e) => this.submitMessage(e));
         }
-        
-        // 添加定期刷新
-        setInterval(() => this.loadMessages(), 60000); // 每60秒刷新一次
     }
     
     formatDate(dateString) {
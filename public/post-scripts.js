@@ -1,6 +1,13 @@
 document.addEventListener('DOMContentLoaded', async () => {
     const postContainer = document.querySelector('.post-detail');
     
+    // 预渲染的静态文章页（/p/{id}.html）：正文已在页面中，只记录阅读并刷新阅读数
+    if (postContainer.dataset.postId) {
+        recordView(postContainer.dataset.postId);
+        loadRelatedPosts(postContainer.dataset.postId, true);
+        return;
+    }
+    
     // 从URL获取文章ID
     const urlParams = new URLSearchParams(window.location.search);
     const postId = urlParams.get('id');
@@ -31,6 +38,8 @@ document.addEventListener('DOMContentLoaded', async () => {
         // 更新页面标题
         document.title = `${post.title} - 我的个人博客`;
         
+        loadRelatedPosts(post.id, false);
+        
     } catch (error) {
         console.error('加载文章详情失败:', error);
         showError(`加载失败: ${error.message}`);
@@ -55,12 +64,61 @@ function renderPost(post) {
         
         <div class="post-footer">
             <div class="tag-list">
-                ${post.tags.map(tag => `<span class="tag">${tag}</span>`).join('')}
+                ${post.tags.map(tag => `<span class="tag">${tag.name}</span>`).join('')}
             </div>
         </div>
     `;
 }
 
+async function recordView(postId) {
+    try {
+        const response = await fetch(`/api/posts/${postId}/view`, { method: 'POST' });
+        if (!response.ok) {
+            return;
+        }
+        const { view_count } = await response.json();
+        const viewCount = document.querySelector('.view-count');
+        if (viewCount) {
+            viewCount.textContent = `阅读: ${view_count}`;
+        }
+    } catch (error) {
+        console.error('记录阅读数失败:', error);
+    }
+}
+
+async function loadRelatedPosts(postId, staticLinks) {
+    // 相关文章只是附加内容，加载失败时不显示
+    try {
+        const response = await fetch(`/api/posts/${postId}/related`);
+        if (!response.ok) {
+            return;
+        }
+        const { posts } = await response.json();
+        if (!posts.length) {
+            return;
+        }
+        const postUrl = post => staticLinks ? `/p/${post.id}.html` : `/post.html?id=${post.id}`;
+        const section = document.createElement('section');
+        section.className = 'related-posts';
+        section.innerHTML = `
+            <h2>相关文章</h2>
+            <ul>
+                ${posts.map(post => `
+                    <li>
+                        <a href="${postUrl(post)}" class="post-link">${post.title}</a>
+                        <span class="tag-list">
+                            ${post.tags.map(tag => `<span class="tag">${tag.name}</span>`).join('')}
+                        </span>
+                    </li>
+                `).join('')}
+            </ul>
+        `;
+        document.querySelector('.post-detail').after(section);
+    } catch (error) {
+        console.error('加载相关文章失败:', error);
+    }
+}
+
 function formatContent(content) {
     // 将内容按段落分割并添加HTML标签
     return content
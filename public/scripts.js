@@ -1,47 +1,81 @@
+const PAGE_SIZE = 12;
+
 document.addEventListener('DOMContentLoaded', async () => {
     const postsContainer = document.getElementById('posts-list');
+    let nextCursor = null;
     
-    try {
-        // 调用后端API获取文章数据
-        const response = await fetch('/api/posts');
+    // 预渲染的静态列表页（/page/{n}.html）：文章已在页面中，只需绑定点击
+    if (postsContainer.dataset.staticPage) {
+        bindPostCards(postsContainer);
+        return;
+    }
+    
+    // 优先读取 scripts/export_static.py 生成的列表快照，不存在时改用 API
+    let useSnapshot = true;
+    let snapshotPage = 0;
+    
+    // 加载更多按钮（放在列表下方）
+    const loadMoreButton = document.createElement('button');
+    loadMoreButton.className = 'load-more-button';
+    loadMoreButton.textContent = '加载更多';
+    loadMoreButton.style.display = 'none';
+    postsContainer.after(loadMoreButton);
+    
+    async function loadSnapshotPage() {
+        const response = await fetch(`/data/pages/${snapshotPage + 1}.json`);
         if (!response.ok) {
-            throw new Error(`HTTP错误: ${response.status}`);
+            return null;
+        }
+        const page = await response.json();
+        snapshotPage = page.page;
+        return page;
+    }
+    
+    async function loadPage(append) {
+        if (useSnapshot) {
+            const page = await loadSnapshotPage();
+            if (page) {
+                renderPosts(postsContainer, page.posts, append, true);
+                loadMoreButton.style.display = page.page < page.total_pages ? 'block' : 'none';
+                return;
+            }
+            if (snapshotPage > 0) {
+                throw new Error('文章列表快照加载失败');
+            }
+            useSnapshot = false;
         }
-        const posts = await response.json();
-        
-        // ... 之前的代码保持不变 ...
-
-        // 在获取文章数据后，修改渲染部分：
-        postsContainer.innerHTML = posts.map(post => `
-            <article class="post-card" data-post-id="${post.id}">
-                <div class="post-content">
-                    <h3><a href="/post.html?id=${post.id}" class="post-link">${post.title}</a></h3>
-                    <p>${post.excerpt || post.content.substring(0, 120)}...</p>
-                    <div class="post-meta">
-                        <span>发布于 ${new Date(post.created_at).toLocaleDateString('zh-CN')}</span>
-                        <span>阅读: ${post.view_count || 0}</span>
-                    </div>
-                    <div class="tag-list">
-                        ${(post.tags || []).map(tag => `<span class="tag">${tag.name}</span>`).join('')}
-                    </div>
-                </div>
-            </article>
-        `).join('');
         
-        // 添加卡片悬停效果
-        document.querySelectorAll('.post-card').forEach(card => {
-            card.addEventListener('click', (e) => {
-                // 防止链接点击被阻止
-                if (!e.target.closest('.post-link')) {
-                    const postId = card.dataset.postId;
-                    window.location.href = `/post.html?id=${postId}`;
-                }
-            });
-            
-            // 添加点击光标样式
-            card.style.cursor = 'pointer';
-        });
+        // 调用后端API获取一页文章数据
+        const params = new URLSearchParams({ limit: PAGE_SIZE });
+        if (nextCursor) {
+            params.set('cursor', nextCursor);
+        }
+        const response = await fetch(`/api/posts?${params}`);
+        if (!response.ok) {
+            throw new Error(`HTTP错误: ${response.status}`);
+        }
+        const page = await response.json();
+        nextCursor = page.next_cursor;
         
+        renderPosts(postsContainer, page.posts, append);
+        loadMoreButton.style.display = nextCursor ? 'block' : 'none';
+    }
+    
+    loadMoreButton.addEventListener('click', async () => {
+        loadMoreButton.disabled = true;
+        loadMoreButton.textContent = '加载中...';
+        try {
+            await loadPage(true);
+        } catch (error) {
+            console.error('加载更多文章失败:', error);
+        } finally {
+            loadMoreButton.disabled = false;
+            loadMoreButton.textContent = '加载更多';
+        }
+    });
+    
+    try {
+        await loadPage(false);
     } catch (error) {
         console.error('加载文章失败:', error);
         postsContainer.innerHTML = `
@@ -57,6 +91,50 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
 });
 
+function renderPosts(postsContainer, posts, append, staticLinks = false) {
+    // 使用快照时链接到预渲染的文章页
+    const postUrl = post => staticLinks ? `/p/${post.id}.html` : `/post.html?id=${post.id}`;
+    const html = posts.map(post => `
+        <article class="post-card" data-post-id="${post.id}" data-href="${postUrl(post)}">
+            <div class="post-content">
+                <h3><a href="${postUrl(post)}" class="post-link">${post.title}</a></h3>
+                <p>${post.excerpt || ''}...</p>
+                <div class="post-meta">
+                    <span>发布于 ${new Date(post.created_at).toLocaleDateString('zh-CN')}</span>
+                    <span>阅读: ${post.view_count || 0}</span>
+                </div>
+                <div class="tag-list">
+                    ${(post.tags || []).map(tag => `<span class="tag">${tag.name}</span>`).join('')}
+                </div>
+            </div>
+        </article>
+    `).join('');
+    
+    if (append) {
+        postsContainer.insertAdjacentHTML('beforeend', html);
+    } else {
+        postsContainer.innerHTML = html;
+    }
+    
+    bindPostCards(postsContainer);
+}
+
+function bindPostCards(postsContainer) {
+    // 添加卡片点击效果（只处理新渲染的卡片）
+    postsContainer.querySelectorAll('.post-card:not([data-bound])').forEach(card => {
+        card.dataset.bound = 'true';
+        card.addEventListener('click', (e) => {
+            // 防止链接点击被阻止
+            if (!e.target.closest('.post-link')) {
+                window.location.href = card.dataset.href;
+            }
+        });
+        
+        // 添加点击光标样式
+        card.style.cursor = 'pointer';
+    });
+}
+
 // 添加文章链接的样式
 const style = document.createElement('style');
 style.textContent = `
@@ -68,6 +146,27 @@ style.textContent = `
     .post-link:hover {
         color: var(--primary);
     }
+    .load-more-button {
+        display: block;
+        margin: 2rem auto 0;
+        padding: 0.6rem 2rem;
+        background: var(--primary);
+        color: white;
+        border: none;
+        border-radius: 4px;
+        cursor: pointer;
+    }
+    .load-more-button:disabled {
+        opacity: 0.6;
+        cursor: default;
+    }
+    .pagination {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        gap: 1rem;
+        margin-top: 2rem;
+    }
 `;
 document.head.appendChild(style);
 
@@ -0,0 +1,115 @@
+"""冷启动延迟测量
+
+每轮启动一个全新的 Python 进程：导入 api/index.py、执行 startup 事件、
+完成第一个请求，分别记录耗时，最后汇总 p50 / p99。
+
+用法：
+    python scripts/bench_cold_start.py --runs 20
+    python scripts/bench_cold_start.py --runs 20 --baseline-rev e6298d1
+
+--baseline-rev 会从 git 取出指定提交的 api/index.py 作为对照组，
+两组在同一数据库、同一机器上交替运行。需要可用的 MySQL（读取 MYSQL_* 环境变量）
+以及 httpx。
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from bench_common import percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 测量用的 httpx 在计时开始前导入，不计入应用的导入和启动耗时
+CHILD = r"""
+import asyncio, importlib.util, json, sys, time
+import httpx
+t0 = time.perf_counter()
+spec = importlib.util.spec_from_file_location("cold_start_target", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+t_import = time.perf_counter()
+
+async def main():
+    await module.app.router.startup()
+    t_startup = time.perf_counter()
+    transport = httpx.ASGITransport(app=module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(sys.argv[2])
+    t_first = time.perf_counter()
+    await module.app.router.shutdown()
+    print(json.dumps({
+        "status": response.status_code,
+        "import": t_import - t0,
+        "startup": t_startup - t_import,
+        "first_request": t_first - t_startup,
+        "total": t_first - t0,
+    }))
+
+asyncio.run(main())
+"""
+
+def run_once(target: str, path: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, target, path],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        # 常见原因：对照组在 startup 中连接数据库，而 MYSQL_* 指向的数据库不可用
+        sys.exit(f"冷启动子进程失败（{target}）：\n{result.stderr.strip()[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def summarize(samples):
+    summary = {}
+    for key in ("import", "startup", "first_request", "total"):
+        values = [sample[key] * 1000 for sample in samples]
+        summary[key] = {"p50_ms": round(percentile(values, 50), 2), "p99_ms": round(percentile(values, 99), 2)}
+    # 首个请求的状态码：数据库不可用时仍能测出导入和启动耗时，但 first_request 不代表正常响应
+    statuses = {}
+    for sample in samples:
+        statuses[str(sample["status"])] = statuses.get(str(sample["status"]), 0) + 1
+    summary["statuses"] = statuses
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="测量 api/index.py 冷启动延迟")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--path", default="/api/health", help="冷启动后请求的路径")
+    parser.add_argument("--baseline-rev", help="对照组的 git 提交")
+    parser.add_argument("--output", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    targets = {"current": os.path.join(ROOT, "api", "index.py")}
+    if args.baseline_rev:
+        source = subprocess.run(
+            ["git", "show", f"{args.baseline_rev}:api/index.py"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        baseline = tempfile.NamedTemporaryFile("w", suffix="_index.py", delete=False, encoding="utf-8")
+        baseline.write(source)
+        baseline.close()
+        targets["baseline"] = baseline.name
+
+    samples = {name: [] for name in targets}
+    for _ in range(args.runs):
+        for name, target in targets.items():
+            samples[name].append(run_once(target, args.path))
+
+    report = {name: summarize(runs) for name, runs in samples.items()}
+    for name, summary in report.items():
+        print(f"[{name}] 首个请求状态码: {summary['statuses']}")
+        for key, stats in summary.items():
+            if key != "statuses":
+                print(f"  {key:<14} p50 {stats['p50_ms']:>9.2f} ms   p99 {stats['p99_ms']:>9.2f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "path": args.path, "report": report}, f, indent=2)
+
+    if args.baseline_rev:
+        os.unlink(targets["baseline"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""压测与基准脚本共用的统计函数（load_test.py、bench_cold_start.py）"""
+import math
+
+def percentile(values, pct):
+    """最近秩法计算百分位（秩为 ceil(pct% × n)）"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[index]
@@ -0,0 +1,90 @@
+"""JSON 编码耗时基准：1,000 篇文章的列表响应
+
+对比三种编码方式：
+  - baseline：FastAPI 默认的 jsonable_encoder + JSONResponse
+  - adapter：api/index.py 中预编译的 Pydantic v2 序列化器（首次编码，行缓存为空）
+  - row-cache：行缓存命中时的编码（行未变化的重复请求）
+
+用法：
+    python scripts/bench_serialize.py --posts 1000 --repeat 50
+
+不需要数据库，文章数据为合成数据。
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from api import index  # noqa: E402
+
+TAGS = [
+    {"id": 1, "name": "Python", "slug": "python"},
+    {"id": 2, "name": "编程", "slug": "programming"},
+    {"id": 3, "name": "部署", "slug": "deployment"},
+]
+
+def make_posts(count: int):
+    base = datetime(2025, 1, 1, 10, 0, 0)
+    return [
+        {
+            "id": i,
+            "title": f"第{i}篇：使用 FastAPI 与 Vercel 部署个人博客",
+            "excerpt": "本文记录了将 Python 应用部署到 Vercel 的完整过程，包括数据库连接池、冷启动优化与缓存策略。" * 2,
+            "cover_image": f"https://example.com/covers/{i}.jpg" if i % 3 else None,
+            "status": "published",
+            "view_count": i * 7,
+            "created_at": base - timedelta(hours=i),
+            "updated_at": base - timedelta(hours=i) + timedelta(minutes=5),
+            "tags": TAGS[: (i % 3) + 1],
+        }
+        for i in range(1, count + 1)
+    ]
+
+def timeit(func, repeat: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="比较文章列表的 JSON 编码耗时")
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    posts = make_posts(args.posts)
+    payload = {"limit": args.posts, "next_cursor": None, "posts": posts}
+
+    def baseline():
+        return JSONResponse(jsonable_encoder(payload)).body
+
+    def adapter():
+        index.row_json_cache.entries.clear()
+        return index.encode_posts_page(args.posts, None, posts)
+
+    def row_cache():
+        return index.encode_posts_page(args.posts, None, posts)
+
+    # 三种方式输出的字节必须完全一致
+    assert baseline() == adapter() == row_cache()
+
+    results = {
+        "baseline": timeit(baseline, args.repeat),
+        "adapter": timeit(adapter, args.repeat),
+        "row-cache": timeit(row_cache, args.repeat),
+    }
+    size = len(row_cache())
+    print(f"{args.posts} 篇文章，响应体 {size / 1024:.1f} KiB，每种方式重复 {args.repeat} 次")
+    for name, ms in results.items():
+        speedup = results["baseline"] / ms
+        print(f"  {name:<10} {ms:9.3f} ms/次   {speedup:6.1f}x")
+
+if __name__ == "__main__":
+    main()
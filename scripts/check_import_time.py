@@ -0,0 +1,72 @@
+"""冷启动导入耗时检查（基于 python -X importtime）
+
+每轮在全新的 Python 进程中导入 api/index.py，解析 -X importtime 的输出：
+  - 汇总 api.index 的累计导入耗时（取各轮中位数），超过 --budget-ms 时失败
+  - 检查不应在导入阶段加载的模块（数据库驱动、python-dotenv 等）是否被提前导入
+  - 列出自身耗时最多的模块，便于定位新引入的重依赖
+
+子进程中设置了 MYSQL_HOST，模拟部署平台已注入环境变量的情况（此时不应导入 dotenv）。
+
+用法：
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --runs 5 --budget-ms 1500 --top 15
+
+检查失败时退出码为 1，可以放在部署前的检查步骤里。
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 只应在第一次访问数据库或显式需要时才导入的模块
+DEFERRED_MODULES = ("pymysql", "aiomysql.pool", "aiomysql.connection", "dotenv", "redis", "brotli")
+
+def import_profile() -> dict:
+    """在新进程中导入 api.index，返回 {模块名: (自身微秒, 累计微秒)}"""
+    env = dict(os.environ, MYSQL_HOST=os.environ.get("MYSQL_HOST", "127.0.0.1"), PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api.index"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+def main():
+    parser = argparse.ArgumentParser(description="检查 api/index.py 的导入耗时")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500, help="api.index 累计导入耗时上限（中位数）")
+    parser.add_argument("--top", type=int, default=10, help="列出自身耗时最多的模块数")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    total_ms = statistics.median(profile["api.index"][1] for profile in profiles) / 1000
+    module_ms = statistics.median(profile["api.index"][0] for profile in profiles) / 1000
+
+    eager = sorted({name for profile in profiles for name in profile if name in DEFERRED_MODULES})
+
+    last = profiles[-1]
+    slowest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    print(f"api.index 导入耗时（{args.runs} 轮中位数）：累计 {total_ms:.1f} ms，模块自身 {module_ms:.1f} ms")
+    print(f"自身耗时最多的 {args.top} 个模块（最后一轮）：")
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"  {self_us / 1000:8.1f} ms  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"导入耗时 {total_ms:.1f} ms 超过预算 {args.budget_ms:.0f} ms")
+    if eager:
+        failures.append(f"以下模块应延迟导入，却在导入阶段被加载：{', '.join(eager)}")
+    for failure in failures:
+        print(f"失败：{failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
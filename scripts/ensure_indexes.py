@@ -0,0 +1,46 @@
+"""创建热点查询依赖的索引，并检查热点查询的执行计划
+
+用法：
+    python scripts/ensure_indexes.py            # 创建缺失索引并检查执行计划
+    python scripts/ensure_indexes.py --dry-run  # 只检查执行计划
+
+读取与应用相同的 MYSQL_* 环境变量。索引定义见 api/index.py 中的 INDEXES，
+热点查询见 HOT_QUERIES。应用默认不在冷启动时做 EXPLAIN 检查（SQL_EXPLAIN_CHECK=0），
+请在部署或修改 SQL 后运行本脚本；有热点查询未使用索引时退出码为 1。
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import index  # noqa: E402
+
+async def main(dry_run: bool) -> int:
+    try:
+        if not dry_run:
+            created = await index.ensure_indexes()
+            print(f"新建索引: {', '.join(created) if created else '无'}")
+
+        plans = await index.explain_hot_queries()
+        unindexed = []
+        for name, plan in plans.items():
+            print(f"[{name}]")
+            for row in plan:
+                print(f"  table={row.get('table')} type={row.get('type')} key={row.get('key')} "
+                      f"rows={row.get('rows')} extra={row.get('Extra')}")
+            if index.unindexed_rows(plan):
+                unindexed.append(name)
+    finally:
+        await index.close_db_connection()
+
+    if unindexed:
+        print(f"失败：以下热点查询未使用索引：{', '.join(unindexed)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="创建缺失索引并检查热点查询的执行计划")
+    parser.add_argument("--dry-run", action="store_true", help="不创建索引，只打印执行计划")
+    sys.exit(asyncio.run(main(parser.parse_args().dry_run)))
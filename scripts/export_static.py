@@ -0,0 +1,232 @@
+"""把已发布文章和文章列表预渲染为静态文件，交给 @vercel/static 直接提供
+
+    python scripts/export_static.py              # 增量导出：只重新生成 updated_at 变化的文章和列表页
+    python scripts/export_static.py --full       # 全量重新生成
+    vercel deploy                                # 导出后再部署（生成的文件已加入 .gitignore）
+
+生成到 public/ 下：
+    p/{id}.html            文章页（正文已渲染，阅读数通过 POST /api/posts/{id}/view 记录并显示）
+    page/{n}.html          文章列表页
+    data/posts/{id}.json   文章 JSON 快照（与 GET /api/posts/{id} 格式相同）
+    data/pages/{n}.json    列表 JSON 快照 {page, total_pages, posts}，首页脚本优先读取
+    data/manifest.json     上次导出时每篇文章的 updated_at 和每个列表页的签名
+
+读取与应用相同的 MYSQL_* 环境变量。只修改标签而不更新 updated_at 的文章需要 --full。
+"""
+import argparse
+import asyncio
+import hashlib
+import html
+import json
+import os
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from api import index  # noqa: E402
+
+PUBLIC = os.path.join(ROOT, "public")
+MANIFEST = os.path.join(PUBLIC, "data", "manifest.json")
+PAGE_SIZE = 12  # 与 public/scripts.js 中的 PAGE_SIZE 一致
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="/styles.css">
+</head>
+<body>
+    <header>
+        <h1>我的技术博客</h1>
+        <p>分享Python开发与云原生技术</p>
+{back}    </header>
+
+{main}
+
+    <footer>
+        <p>© 2025 我的个人博客 | 使用FastAPI + Vercel构建</p>
+    </footer>
+
+    <script src="{script}"></script>
+</body>
+</html>
+"""
+
+BACK_LINK = '        <a href="/" class="back-button">← 返回首页</a>\n'
+
+def format_date(value: datetime) -> str:
+    """与前端 toLocaleDateString('zh-CN') 的输出一致"""
+    return f"{value.year}/{value.month}/{value.day}"
+
+def render_tags(tags) -> str:
+    return "".join(f'<span class="tag">{tag["name"]}</span>' for tag in tags)
+
+def render_post(post: dict) -> str:
+    # 与 post-scripts.js 的 renderPost/formatContent 保持相同的结构，正文按原样输出
+    paragraphs = "".join(f"<p>{line}</p>" for line in post["content"].split("\n") if line.strip())
+    main = f"""    <main class="post-detail-container">
+        <article class="post-detail" data-post-id="{post['id']}">
+            <div class="post-header">
+                <h1>{post['title']}</h1>
+                <div class="post-meta">
+                    <span>发布时间: {format_date(post['created_at'])} {post['created_at']:%H:%M}</span>
+                    <span>文章ID: {post['id']}</span>
+                    <span class="view-count">阅读: {post['view_count']}</span>
+                </div>
+            </div>
+
+            <div class="post-content">
+                {paragraphs}
+            </div>
+
+            <div class="post-footer">
+                <div class="tag-list">
+                    {render_tags(post['tags'])}
+                </div>
+            </div>
+        </article>
+    </main>"""
+    return PAGE_TEMPLATE.format(
+        title=f"{html.escape(post['title'])} - 我的个人博客",
+        back=BACK_LINK, main=main, script="/post-scripts.js"
+    )
+
+def render_page(page: int, total_pages: int, posts) -> str:
+    # 与 scripts.js 的 renderPosts 保持相同的卡片结构，链接指向静态文章页
+    cards = "".join(f"""
+        <article class="post-card" data-post-id="{post['id']}" data-href="/p/{post['id']}.html">
+            <div class="post-content">
+                <h3><a href="/p/{post['id']}.html" class="post-link">{post['title']}</a></h3>
+                <p>{post['excerpt'] or ''}...</p>
+                <div class="post-meta">
+                    <span>发布于 {format_date(post['created_at'])}</span>
+                    <span>阅读: {post['view_count'] or 0}</span>
+                </div>
+                <div class="tag-list">
+                    {render_tags(post['tags'])}
+                </div>
+            </div>
+        </article>""" for post in posts)
+
+    links = []
+    if page > 1:
+        links.append(f'<a href="/page/{page - 1}.html" class="back-button">← 上一页</a>')
+    links.append(f"<span>第 {page} / {total_pages} 页</span>")
+    if page < total_pages:
+        links.append(f'<a href="/page/{page + 1}.html" class="back-button">下一页 →</a>')
+
+    main = f"""    <main>
+        <section class="posts-container">
+            <h2>最新文章</h2>
+            <div id="posts-list" data-static-page="{page}">{cards}
+            </div>
+            <nav class="pagination">
+                {' '.join(links)}
+            </nav>
+        </section>
+    </main>"""
+    return PAGE_TEMPLATE.format(
+        title=f"第 {page} 页 - 我的个人博客",
+        back=BACK_LINK if page > 1 else "", main=main, script="/scripts.js"
+    )
+
+def write_file(relative: str, data):
+    """先写临时文件再替换，部署过程中不会读到写了一半的文件"""
+    path = os.path.join(PUBLIC, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data if isinstance(data, bytes) else data.encode("utf-8"))
+    os.replace(tmp, path)
+
+def remove_file(relative: str):
+    try:
+        os.remove(os.path.join(PUBLIC, relative))
+    except FileNotFoundError:
+        pass
+
+def page_signature(posts) -> str:
+    """列表页签名：文章集合、顺序或任一文章 updated_at 变化时才重新生成（阅读数不计入）"""
+    digest = hashlib.blake2b(digest_size=12)
+    for post in posts:
+        digest.update(f"{post['id']}:{post['updated_at'].isoformat()};".encode())
+    return digest.hexdigest()
+
+async def list_published():
+    """按列表顺序取出所有已发布文章的摘要（每次取 POSTS_PAGE_MAX 篇）"""
+    posts, cursor = [], None
+    while True:
+        batch, cursor = await index.fetch_posts_page(page_cursor=cursor, limit=index.POSTS_PAGE_MAX)
+        posts.extend(batch)
+        if not cursor:
+            return posts
+
+async def export(full: bool):
+    manifest = {"posts": {}, "pages": {}}
+    if os.path.exists(MANIFEST):
+        with open(MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    # 用于比较的版本；--full 或每页篇数变化时视为全部过期，但仍按旧清单删除多余文件
+    known_posts = {} if full else manifest["posts"]
+    known_pages = {} if full or manifest.get("page_size") != PAGE_SIZE else manifest["pages"]
+
+    posts = await list_published()
+    current = {str(post["id"]): post["updated_at"].isoformat() for post in posts}
+
+    # 文章页：新增或 updated_at 变化的重新生成，已下线的删除
+    changed = [post for post in posts if known_posts.get(str(post["id"])) != current[str(post["id"])]]
+    for post in changed:
+        detail = await index.load_post(post["id"])
+        if detail is None:
+            continue
+        write_file(f"p/{post['id']}.html", render_post(detail))
+        write_file(f"data/posts/{post['id']}.json", index.encode_model(index.blog_post_adapter, detail))
+    removed = [post_id for post_id in manifest["posts"] if post_id not in current]
+    for post_id in removed:
+        remove_file(f"p/{post_id}.html")
+        remove_file(f"data/posts/{post_id}.json")
+
+    # 列表页：按签名判断是否需要重新生成
+    total_pages = max(1, -(-len(posts) // PAGE_SIZE))
+    signatures, pages_written = {}, 0
+    for page in range(1, total_pages + 1):
+        chunk = posts[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        # 总页数变化会影响每一页的分页导航
+        signature = f"{total_pages}:{page_signature(chunk)}"
+        signatures[str(page)] = signature
+        if known_pages.get(str(page)) == signature:
+            continue
+        write_file(f"page/{page}.html", render_page(page, total_pages, chunk))
+        write_file(f"data/pages/{page}.json", index.encode_envelope(
+            {"page": page, "total_pages": total_pages}, "posts",
+            [index.encode_model(index.post_summary_adapter, post) for post in chunk]
+        ))
+        pages_written += 1
+    for page in manifest["pages"]:
+        if int(page) > total_pages:
+            remove_file(f"page/{page}.html")
+            remove_file(f"data/pages/{page}.json")
+
+    write_file("data/manifest.json", json.dumps({
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "page_size": PAGE_SIZE,
+        "posts": current,
+        "pages": signatures,
+    }, indent=2))
+    print(f"文章页: 生成 {len(changed)}，删除 {len(removed)}，共 {len(posts)} 篇")
+    print(f"列表页: 生成 {pages_written}，共 {total_pages} 页")
+
+async def main(full: bool):
+    try:
+        await export(full)
+    finally:
+        await index.close_db_connection()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="预渲染文章页和列表页到 public/")
+    parser.add_argument("--full", action="store_true", help="忽略上次导出的清单，全部重新生成")
+    asyncio.run(main(parser.parse_args().full))
@@ -0,0 +1,347 @@
+"""博客 API 压测
+
+两个子命令：
+
+    # 1. 按 scripts/schema.sql 建表并写入合成数据（默认 1 万篇文章、5 万条文章标签、100 万条留言）
+    python scripts/load_test.py seed --posts 10000 --tag-links 50000 --messages 1000000
+    python scripts/ensure_indexes.py
+
+    # 2. 启动服务后逐个场景并发压测，结果写入 JSON，并与上一次结果对比
+    uvicorn api.index:app --port 8000
+    python scripts/load_test.py run --base-url http://127.0.0.1:8000 \\
+        --concurrency 20 --requests 500 --output results.json --baseline last.json
+
+seed 读取与应用相同的 MYSQL_* 环境变量，只需 pymysql；run 需要 httpx。
+每个场景单独运行，前后各抓取一次 /api/metrics，用 db_query_duration_seconds_count
+的差值计算每个请求平均执行的 SQL 条数。/api/memorial/stream 是长连接，不在压测范围内。
+需要管理员权限的场景（审核、批量审核、导出）只在提供 --admin-token（或 ADMIN_TOKEN 环境变量）时运行；
+审核场景只把已审核的留言再设为 approved，不改变数据；导出场景的并发超过服务端
+EXPORT_MAX_CONCURRENT 时，多出的请求按设计返回 429，会计入 errors。
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bench_common import percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORDS = [
+    "性能", "数据库", "缓存", "索引", "异步", "并发", "连接池", "分页", "搜索", "部署",
+    "服务器", "前端", "后端", "纪念", "回忆", "旅行", "读书", "生活", "算法", "测试",
+    "python", "fastapi", "mysql", "vercel", "redis", "linux", "docker", "http", "json", "async",
+]
+
+# ---------------------------------------------------------------- 数据生成
+
+def connect():
+    import pymysql
+    return pymysql.connect(
+        host=os.getenv("MYSQL_HOST", "localhost"),
+        port=int(os.getenv("MYSQL_PORT", 3306)),
+        user=os.getenv("MYSQL_USER", "root"),
+        password=os.getenv("MYSQL_PASSWORD", ""),
+        database=os.getenv("MYSQL_DATABASE", "blog_db"),
+        charset="utf8mb4",
+        autocommit=False,
+    )
+
+def insert_batches(conn, sql: str, rows, batch_size: int, label: str):
+    """分批写入（pymysql 会把 executemany 合并为多行 INSERT）"""
+    batch, total = [], 0
+    with conn.cursor() as cursor:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                cursor.executemany(sql, batch)
+                conn.commit()
+                total += len(batch)
+                batch = []
+                print(f"\r  {label}: {total}", end="", flush=True)
+        if batch:
+            cursor.executemany(sql, batch)
+            conn.commit()
+            total += len(batch)
+    print(f"\r  {label}: {total}")
+
+def sentence(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(WORDS) + ("，" if rng.random() < 0.2 else "") for _ in range(length))
+
+def seed(args):
+    rng = random.Random(args.seed)
+    now = datetime.now().replace(microsecond=0)
+    conn = connect()
+    try:
+        with conn.cursor() as cursor:
+            with open(os.path.join(ROOT, "scripts", "schema.sql"), encoding="utf-8") as f:
+                for statement in f.read().split(";"):
+                    lines = [line for line in statement.splitlines() if not line.strip().startswith("--")]
+                    if "".join(lines).strip():
+                        cursor.execute("\n".join(lines))
+            if not args.append:
+                for table in ("post_tags", "tags", "blog_posts", "memorial_messages"):
+                    cursor.execute(f"TRUNCATE TABLE {table}")
+        conn.commit()
+
+        print("写入数据：")
+        insert_batches(conn, "INSERT INTO tags (name, slug) VALUES (%s, %s)", (
+            (f"标签{i}", f"tag-{i}") for i in range(1, args.tags + 1)
+        ), args.batch, "tags")
+
+        def posts():
+            for i in range(1, args.posts + 1):
+                created = now - timedelta(seconds=rng.randint(0, 3 * 365 * 86400))
+                content = "\n\n".join(sentence(rng, rng.randint(40, 120)) for _ in range(rng.randint(3, 8)))
+                yield (
+                    f"{sentence(rng, 3)} 第{i}篇",
+                    content,
+                    content[:120],
+                    "draft" if rng.random() < 0.05 else "published",
+                    rng.randint(0, 5000),
+                    created,
+                    created + timedelta(seconds=rng.randint(0, 86400 * 30)),
+                )
+        insert_batches(conn, """
+            INSERT INTO blog_posts (title, content, excerpt, status, view_count, created_at, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, posts(), max(1, args.batch // 10), "blog_posts")
+
+        def tag_links():
+            links = set()
+            while len(links) < min(args.tag_links, args.posts * args.tags):
+                links.add((rng.randint(1, args.posts), rng.randint(1, args.tags)))
+            yield from sorted(links)
+        insert_batches(conn, "INSERT INTO post_tags (post_id, tag_id) VALUES (%s, %s)",
+                       tag_links(), args.batch, "post_tags")
+
+        def messages():
+            for i in range(1, args.messages + 1):
+                roll = rng.random()
+                yield (
+                    f"访客{rng.randint(1, 100000)}",
+                    sentence(rng, rng.randint(5, 40)),
+                    f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+                    "pending" if roll < 0.1 else "rejected" if roll < 0.12 else "approved",
+                    now - timedelta(seconds=rng.randint(0, 365 * 86400)),
+                )
+        insert_batches(conn, """
+            INSERT INTO memorial_messages (author_name, message_content, author_ip, status, created_at)
+            VALUES (%s, %s, %s, %s, %s)
+        """, messages(), args.batch, "memorial_messages")
+    finally:
+        conn.close()
+
+# ---------------------------------------------------------------- 压测
+
+_QUERY_COUNT_RE = re.compile(r"^db_query_duration_seconds_count\{[^}]*\} (\S+)$", re.M)
+
+async def db_query_total(client) -> float:
+    response = await client.get("/api/metrics")
+    if response.status_code != 200:
+        return float("nan")
+    return sum(float(value) for value in _QUERY_COUNT_RE.findall(response.text))
+
+async def discover(client, rng: random.Random) -> dict:
+    """从首页和留言列表取得文章ID、游标和留言ID，供后续场景使用"""
+    page = (await client.get("/api/posts", params={"limit": 100})).json()
+    messages = (await client.get("/api/memorial/messages", params={"limit": 200})).json()
+    post_ids = [post["id"] for post in page["posts"]] or [1]
+    tags = sorted({tag["name"] for post in page["posts"] for tag in post.get("tags", [])}) or ["标签1"]
+    tag_slugs = sorted({tag["slug"] for post in page["posts"] for tag in post.get("tags", [])}) or ["tag-1"]
+    return {
+        "post_ids": post_ids,
+        "cursor": page.get("next_cursor"),
+        "tags": tags,
+        "tag_slugs": tag_slugs,
+        "message_ids": [message["id"] for message in messages["messages"]] or [1],
+        "message_total": messages.get("total", 0),
+    }
+
+ADMIN_SCENARIOS = ("message_status", "bulk_status", "export_messages", "export_posts")
+EXPORT_TAIL = 1000  # 导出场景只导出最近的这么多条，避免每个请求都扫全表
+
+def build_scenarios(ctx: dict, rng: random.Random, admin_token: str = None):
+    """场景名 -> 生成 (method, path, kwargs) 的函数"""
+    admin = {"Authorization": f"Bearer {admin_token}"}
+    def post_message(i):
+        return ("POST", "/api/memorial/messages", {
+            "json": {"author_name": f"压测{i}", "message_content": f"{sentence(rng, 10)} #{i} {time.time_ns()}"},
+            # 每个请求使用不同的来源IP，压测写入路径而不是限流
+            "headers": {"X-Forwarded-For": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}"},
+        })
+
+    return {
+        "posts_first_page": lambda i: ("GET", "/api/posts", {}),
+        "posts_cursor_page": lambda i: ("GET", "/api/posts", {"params": {"cursor": ctx["cursor"]} if ctx["cursor"] else {}}),
+        "post_detail": lambda i: ("GET", f"/api/posts/{rng.choice(ctx['post_ids'])}", {}),
+        "post_related": lambda i: ("GET", f"/api/posts/{rng.choice(ctx['post_ids'])}/related", {}),
+        "post_view": lambda i: ("POST", f"/api/posts/{rng.choice(ctx['post_ids'])}/view", {}),
+        "tag_posts": lambda i: ("GET", f"/api/tags/{rng.choice(ctx['tag_slugs'])}/posts", {}),
+        "search_keyword": lambda i: ("GET", "/api/posts/search", {"params": {"keyword": rng.choice(WORDS)}}),
+        "search_tag": lambda i: ("GET", "/api/posts/search", {"params": {"tag": rng.choice(ctx["tags"])}}),
+        "messages_page": lambda i: ("GET", "/api/memorial/messages", {
+            "params": {"limit": 20, "offset": rng.randrange(0, max(1, min(ctx["message_total"], 1000)), 20)}
+        }),
+        "memorial_stats": lambda i: ("GET", "/api/memorial/stats", {}),
+        "message_create": post_message,
+        "message_status": lambda i: ("PUT", f"/api/memorial/messages/{rng.choice(ctx['message_ids'])}/status", {
+            "params": {"status": "approved"}, "headers": admin
+        }),
+        "bulk_status": lambda i: ("POST", "/api/memorial/messages/bulk-status", {
+            "json": {"status": "approved", "ids": rng.sample(ctx["message_ids"], min(50, len(ctx["message_ids"])))},
+            "headers": admin,
+        }),
+        "export_messages": lambda i: ("GET", "/api/export/messages", {
+            "params": {"after_id": max(0, max(ctx["message_ids"]) - EXPORT_TAIL)}, "headers": admin
+        }),
+        "export_posts": lambda i: ("GET", "/api/export/posts", {
+            "params": {"after_id": max(0, max(ctx["post_ids"]) - EXPORT_TAIL)}, "headers": admin
+        }),
+        "health": lambda i: ("GET", "/api/health", {}),
+        "cache_stats": lambda i: ("GET", "/api/cache/stats", {}),
+    }
+
+async def run_scenario(client, make_request, requests: int, concurrency: int, warmup: int) -> dict:
+    for i in range(warmup):
+        method, path, kwargs = make_request(-1 - i)
+        await client.request(method, path, **kwargs)
+
+    latencies, statuses = [], {}
+    counter = iter(range(requests))
+    queries_before = await db_query_total(client)
+
+    async def worker():
+        for i in counter:
+            method, path, kwargs = make_request(i)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                status = str(response.status_code)
+            except Exception as e:
+                status = type(e).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    queries_after = await db_query_total(client)
+
+    errors = sum(count for status, count in statuses.items() if not status.startswith(("2", "3")))
+    return {
+        "requests": requests,
+        "errors": errors,
+        "statuses": statuses,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        # /api/metrics 本身不执行 SQL，差值即场景内所有请求的查询数
+        "db_queries_per_request": round((queries_after - queries_before) / requests, 2),
+    }
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    """打印与基线的对比，返回退化的场景（吞吐下降或 p95 上升超过阈值）"""
+    regressions = []
+    print(f"\n与基线 {baseline.get('meta', {}).get('revision', '?')} 对比：")
+    for name, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        rps_change = (current["rps"] - previous["rps"]) / previous["rps"] if previous["rps"] else 0.0
+        p95_change = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] if previous["p95_ms"] else 0.0
+        flag = ""
+        if rps_change < -threshold or p95_change > threshold:
+            regressions.append(name)
+            flag = "  <-- 退化"
+        print(f"  {name:<20} rps {rps_change:+7.1%}   p95 {p95_change:+7.1%}   "
+              f"sql/req {previous['db_queries_per_request']} -> {current['db_queries_per_request']}{flag}")
+    return regressions
+
+async def run(args):
+    import httpx
+
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        ctx = await discover(client, rng)
+        scenarios = build_scenarios(ctx, rng, args.admin_token)
+        selected = args.scenario or [
+            name for name in scenarios if args.admin_token or name not in ADMIN_SCENARIOS
+        ]
+
+        report = {
+            "meta": {
+                "revision": git_revision(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "base_url": args.base_url,
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+            },
+            "scenarios": {},
+        }
+        print(f"{'场景':<20} {'rps':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'sql/req':>8} {'errors':>7}")
+        for name in selected:
+            result = await run_scenario(client, scenarios[name], args.requests, args.concurrency, args.warmup)
+            report["scenarios"][name] = result
+            print(f"{name:<20} {result['rps']:>8.1f} {result['p50_ms']:>7.2f}ms {result['p95_ms']:>7.2f}ms "
+                  f"{result['p99_ms']:>7.2f}ms {result['db_queries_per_request']:>8} {result['errors']:>7}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    regressions = []
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+    return 1 if regressions and args.fail_on_regression else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="博客 API 压测")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子，保证数据和请求序列可复现")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = sub.add_parser("seed", help="建表并写入合成数据")
+    seed_parser.add_argument("--posts", type=int, default=10000)
+    seed_parser.add_argument("--tags", type=int, default=200)
+    seed_parser.add_argument("--tag-links", type=int, default=50000)
+    seed_parser.add_argument("--messages", type=int, default=1000000)
+    seed_parser.add_argument("--batch", type=int, default=5000, help="每批写入的行数")
+    seed_parser.add_argument("--append", action="store_true", help="保留现有数据（默认先清空四张表）")
+
+    run_parser = sub.add_parser("run", help="并发压测各个接口")
+    run_parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    run_parser.add_argument("--concurrency", type=int, default=20)
+    run_parser.add_argument("--requests", type=int, default=500, help="每个场景的请求数")
+    run_parser.add_argument("--warmup", type=int, default=20, help="每个场景正式计时前的预热请求数")
+    run_parser.add_argument("--scenario", action="append", help="只运行指定场景（可重复）")
+    run_parser.add_argument("--admin-token", default=os.getenv("ADMIN_TOKEN"),
+                            help="管理员令牌，提供时才运行审核和导出场景")
+    run_parser.add_argument("--output", default="load_test_results.json")
+    run_parser.add_argument("--baseline", help="上一次的结果文件，用于对比")
+    run_parser.add_argument("--threshold", type=float, default=0.1, help="判定退化的相对变化")
+    run_parser.add_argument("--fail-on-regression", action="store_true")
+
+    args = parser.parse_args()
+    if args.command == "seed":
+        seed(args)
+    else:
+        sys.exit(asyncio.run(run(args)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+-- 博客与纪念堂的表结构（本地压测/开发用）
+-- 字段与 api/index.py 中 QUERIES 使用的列一致；索引由 scripts/ensure_indexes.py 创建。
+--
+--   mysql -u root blog_db < scripts/schema.sql
+
+CREATE TABLE IF NOT EXISTS blog_posts (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    title VARCHAR(255) NOT NULL,
+    content MEDIUMTEXT NOT NULL,
+    excerpt VARCHAR(500) NULL,
+    cover_image VARCHAR(500) NULL,
+    status ENUM('draft', 'published') NOT NULL DEFAULT 'published',
+    view_count INT UNSIGNED NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS tags (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    name VARCHAR(50) NOT NULL,
+    slug VARCHAR(50) NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE KEY uk_tags_slug (slug)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS post_tags (
+    post_id INT UNSIGNED NOT NULL,
+    tag_id INT UNSIGNED NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS memorial_messages (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    author_name VARCHAR(100) NOT NULL,
+    message_content TEXT NOT NULL,
+    author_ip VARCHAR(45) NULL,
+    status ENUM('pending', 'approved', 'rejected') NOT NULL DEFAULT 'approved',
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;